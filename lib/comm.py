@@ -2,13 +2,23 @@
 
 from __future__ import annotations
 
+import functools
+import itertools
+import json
+import struct
 import threading
 import time
-from typing import Optional
+from typing import List, Optional
 
 import zmq
+from zmq.utils.monitor import recv_monitor_message
 from PyQt6.QtCore import QObject, pyqtSignal
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 # Configuration
 ROBOT_ADDRESSES = [
     "10.42.0.85",
@@ -19,107 +29,342 @@ ROBOT_ADDRESSES = [
 ]
 COMMAND_PORT = 5555
 TELEMETRY_PORT = 5556
+JOYSTICK_PORT = 5557
+# Fire-and-forget keepalive; must stay below the robot's HEARTBEAT_TIMEOUT_S.
 PING_INTERVAL_S = 1
+# Round-trip ping used only for the latency readout.
+LATENCY_PING_INTERVAL_S = 5
+HEARTBEAT_IVL_MS = 1000
 HEARTBEAT_TIMEOUT_S = 2.0
 COMMAND_TIMEOUT_MS = 2000
 TELEMETRY_TIMEOUT_MS = 100
+TELEMETRY_FLUSH_INTERVAL_MS = 50  # How often the GUI picks up the newest telemetry frame.
+RECONNECT_IVL_MS = 200
+RECONNECT_IVL_MAX_MS = 5000
+MONITOR_POLL_MS = 500
+# Joystick samples travel as four little-endian float32s: lx, ly, rx, ry.
+JOYSTICK_FRAME = struct.Struct("<4f")
+
+
+def encode_message(message: dict) -> bytes:
+    """Serialize a command/telemetry dict, preferring msgpack over JSON."""
+    if msgpack is not None:
+        return msgpack.packb(message, use_bin_type=True)
+    return json.dumps(message).encode("utf-8")
+
+
+def decode_message(payload: bytes) -> dict:
+    """Decode a msgpack or JSON payload (JSON always starts with '{')."""
+    if payload[:1] == b"{":
+        return json.loads(payload)
+    if msgpack is None:
+        raise RuntimeError("Received a msgpack payload but msgpack is not installed.")
+    return msgpack.unpackb(payload, raw=False)
+
+
+# Commands whose contents never change are encoded once and the bytes reused.
+PING_PAYLOAD = encode_message({"type": "ping"})
+RESET_PAYLOAD = encode_message({"type": "reset"})
+
+
+@functools.lru_cache(maxsize=None)
+def _mode_payload(mode: str) -> bytes:
+    return encode_message({"type": "mode", "mode": mode})
+
+
+@functools.lru_cache(maxsize=None)
+def _button_payload(button_id: int, action: str) -> bytes:
+    return encode_message({"type": "button", "button_id": button_id, "action": action})
+
 
 class WorkerSignals(QObject):
     """Signals for communication with Qt GUI thread."""
     connection_status = pyqtSignal(bool, str)
     ping_response = pyqtSignal(float)
-    telemetry_update = pyqtSignal(dict)
 
 
 class RobotClient:
-    """Client that manages command (REQ/REP) and telemetry (SUB) sockets."""
-
-    def __init__(self, robot_ip: str):
-        self.robot_ip = robot_ip
-        self.context = zmq.Context()
+    """Client that manages command and post (DEALER), joystick (PUB) and telemetry (SUB) sockets.
+
+    Every socket starts out connected to all candidate addresses and is kept
+    for the life of the process; libzmq reconnects on its own with exponential
+    backoff, so a dropped link never requires rebuilding sockets. Once a robot
+    links up, select_robot() drops the other endpoints so commands, joystick
+    samples and telemetry all involve exactly one robot.
+
+    Commands are framed as ``[request_id, payload]`` so replies can be matched
+    to their request. Fire-and-forget commands (buttons, keepalives) go out on
+    a separate post socket, so they never queue behind a request waiting on its
+    reply; their replies are discarded. Joystick samples use their own
+    conflated PUB socket.
+    """
+
+    def __init__(self, robot_ips: List[str]):
+        self.robot_ips = list(robot_ips)
+        self.robot_ip = ""  # Robot this client is bound to; empty while searching.
+        # Addresses the sockets should be connected to, and what each socket
+        # is connected to now. Sockets catch up on the thread that owns them.
+        self._targets = tuple(self.robot_ips)
+        self._endpoints = {}
+        # Shared process-wide so reconnects do not spin up a new I/O thread each time.
+        self.context = zmq.Context.instance()
         self.signals = WorkerSignals()
 
-        self.command_socket = self.context.socket(zmq.REQ)
-        self.command_socket.connect(f"tcp://{robot_ip}:{COMMAND_PORT}")
-        self.command_socket.setsockopt(zmq.RCVTIMEO, COMMAND_TIMEOUT_MS)
+        self.command_socket = self.context.socket(zmq.DEALER)
+        # Monitor before connect() so the CONNECTED event cannot be missed.
+        self.monitor_socket = self.command_socket.get_monitor_socket(
+            zmq.EVENT_CONNECTED | zmq.EVENT_DISCONNECTED
+        )
+        # ZMTP heartbeats let libzmq detect a dead link and raise EVENT_DISCONNECTED.
+        self.command_socket.setsockopt(zmq.HEARTBEAT_IVL, HEARTBEAT_IVL_MS)
+        self.command_socket.setsockopt(zmq.HEARTBEAT_TIMEOUT, int(HEARTBEAT_TIMEOUT_S * 1000))
+        self.command_socket.setsockopt(zmq.HEARTBEAT_TTL, int(HEARTBEAT_TIMEOUT_S * 1000))
+        # Only queue commands on links that have finished connecting.
+        self.command_socket.setsockopt(zmq.IMMEDIATE, 1)
+        # With IMMEDIATE and no live link a send would block forever; bound it instead.
+        self.command_socket.setsockopt(zmq.SNDTIMEO, COMMAND_TIMEOUT_MS)
         self.command_socket.setsockopt(zmq.LINGER, 0)
+        self._connect_all(self.command_socket, COMMAND_PORT)
+        # ZMQ sockets are not thread-safe; the GUI and receiver threads share this one.
+        self.command_lock = threading.Lock()
+        self._request_ids = itertools.count()
+
+        # Posts get their own DEALER: command_lock is held across a request's
+        # reply wait, and a button press must not stall behind it.
+        self.post_socket = self.context.socket(zmq.DEALER)
+        self.post_socket.setsockopt(zmq.IMMEDIATE, 1)
+        self.post_socket.setsockopt(zmq.LINGER, 0)
+        self._connect_all(self.post_socket, COMMAND_PORT)
+        self.post_lock = threading.Lock()
+
+        # Joystick samples go out on a conflated PUB socket: no reply, and at
+        # most one queued sample, so a stalled link never builds a backlog.
+        self.joystick_socket = self.context.socket(zmq.PUB)
+        self.joystick_socket.setsockopt(zmq.CONFLATE, 1)
+        self.joystick_socket.setsockopt(zmq.SNDHWM, 1)
+        self.joystick_socket.setsockopt(zmq.LINGER, 0)
+        self._connect_all(self.joystick_socket, JOYSTICK_PORT)
+        # Holds the last sample; send() copies it into the outgoing message.
+        self._joystick_buf = bytearray(JOYSTICK_FRAME.size)
+        # The GUI sends samples and the receiver thread repeats them.
+        self.joystick_lock = threading.Lock()
 
         self.telemetry_socket = self.context.socket(zmq.SUB)
-        self.telemetry_socket.connect(f"tcp://{robot_ip}:{TELEMETRY_PORT}")
+        # Telemetry is a full state snapshot, so only the newest frame matters.
+        # CONFLATE must be set before connect().
+        self.telemetry_socket.setsockopt(zmq.CONFLATE, 1)
         self.telemetry_socket.subscribe("")
         self.telemetry_socket.setsockopt(zmq.RCVTIMEO, TELEMETRY_TIMEOUT_MS)
         self.telemetry_socket.setsockopt(zmq.LINGER, 0)
+        self._connect_all(self.telemetry_socket, TELEMETRY_PORT)
 
-        self.connected = False
+        # Written by the receiver and manager threads, read by the GUI thread.
+        self._connected = threading.Event()
         self.running = True
         self.last_ping_time = 0
         self.ping_sent_time = None
 
-        print(f"[RobotClient] Initialized connection to {robot_ip}")
+        print(f"[RobotClient] Initialized connections to {', '.join(self.robot_ips)}")
+
+    def _connect_all(self, sock: zmq.Socket, port: int) -> None:
+        sock.setsockopt(zmq.RECONNECT_IVL, RECONNECT_IVL_MS)
+        sock.setsockopt(zmq.RECONNECT_IVL_MAX, RECONNECT_IVL_MAX_MS)
+        for address in self._targets:
+            sock.connect(f"tcp://{address}:{port}")
+        self._endpoints[sock] = self._targets
+
+    def _sync_endpoints(self, sock: zmq.Socket, port: int) -> None:
+        """Connect/disconnect ``sock`` to match the current targets; caller must own the socket."""
+        targets = self._targets
+        current = self._endpoints[sock]
+        if current is targets:
+            return
+        for address in current:
+            if address not in targets:
+                sock.disconnect(f"tcp://{address}:{port}")
+        for address in targets:
+            if address not in current:
+                sock.connect(f"tcp://{address}:{port}")
+        self._endpoints[sock] = targets
+
+    def select_robot(self, address: Optional[str]) -> None:
+        """Talk only to ``address`` from now on, or search every candidate again if None.
+
+        The lock-guarded sockets switch immediately; the telemetry socket
+        follows when TelemetryReceiver calls sync_telemetry_endpoints().
+        """
+        # robot_ip gates posts and joystick sends, so it is only set once those
+        # sockets point at the one robot, and cleared before they fan out again.
+        if address is None:
+            self.robot_ip = ""
+        self._targets = (address,) if address else tuple(self.robot_ips)
+        with self.command_lock:
+            self._sync_endpoints(self.command_socket, COMMAND_PORT)
+        with self.post_lock:
+            self._sync_endpoints(self.post_socket, COMMAND_PORT)
+        with self.joystick_lock:
+            self._sync_endpoints(self.joystick_socket, JOYSTICK_PORT)
+        if address is not None:
+            self.robot_ip = address
+
+    def sync_telemetry_endpoints(self) -> None:
+        """Apply select_robot() to the telemetry socket; only the thread polling it may call this."""
+        self._sync_endpoints(self.telemetry_socket, TELEMETRY_PORT)
+
+    @property
+    def connected(self) -> bool:
+        return self._connected.is_set()
+
+    def wait_connected(self, timeout: float) -> bool:
+        return self._connected.wait(timeout)
 
     def _set_connected(self, connected: bool) -> None:
-        if self.connected == connected:
+        if self._connected.is_set() == connected:
             return
-        self.connected = connected
+        if connected:
+            self._connected.set()
+        else:
+            self._connected.clear()
         self.signals.connection_status.emit(connected, self.robot_ip if connected else "")
 
+    def _send(self, sock: zmq.Socket, payload: bytes, flags: int = 0) -> bytes:
+        request_id = next(self._request_ids).to_bytes(8, "little")
+        sock.send_multipart([request_id, payload], flags)
+        return request_id
+
+    def _recv_reply(self, request_id: bytes) -> Optional[dict]:
+        deadline = time.monotonic() + COMMAND_TIMEOUT_MS / 1000.0
+        while True:
+            remaining_ms = int((deadline - time.monotonic()) * 1000)
+            if remaining_ms <= 0 or not self.command_socket.poll(remaining_ms):
+                return None
+            reply_id, payload = self.command_socket.recv_multipart()
+            if reply_id == request_id:
+                return decode_message(payload)
+            # Reply to an earlier request that timed out.
+
     def send_command(self, command_type: str, **kwargs) -> Optional[dict]:
         """Send a command to the robot and wait for a response."""
-        try:
-            command = {"type": command_type, "timestamp": time.time(), **kwargs}
-            self.command_socket.send_json(command)
-            response = self.command_socket.recv_json()
+        return self._request(encode_message({"type": command_type, **kwargs}))
 
-            self._set_connected(True)
-            return response
-        except zmq.Again:
+    def _request(self, payload: bytes) -> Optional[dict]:
+        try:
+            with self.command_lock:
+                if not self.running:
+                    return None  # cleanup() closed the socket (under command_lock).
+                request_id = self._send(self.command_socket, payload)
+                response = self._recv_reply(request_id)
+        except Exception as e:
+            print(f"[RobotClient] Command error: {e}")
             self._set_connected(False)
             return None
+
+        self._set_connected(response is not None)
+        return response
+
+    def post_command(self, command_type: str, **kwargs) -> None:
+        """Send a command to the robot without waiting for its reply."""
+        self._post(encode_message({"type": command_type, **kwargs}))
+
+    def _post(self, payload: bytes) -> None:
+        if not self.robot_ip:
+            return  # Still searching; don't send to every candidate robot.
+        try:
+            with self.post_lock:
+                if not self.running:
+                    return  # cleanup() closed the socket (under post_lock).
+                # Post replies are never wanted; drop them so they cannot pile up.
+                while self.post_socket.poll(0):
+                    self.post_socket.recv_multipart()
+                self._send(self.post_socket, payload, zmq.NOBLOCK)
+        except zmq.Again:
+            pass  # No live link to queue on; never stall the caller (often the GUI thread).
         except Exception as e:
             print(f"[RobotClient] Command error: {e}")
             self._set_connected(False)
-            return None
 
-    def send_joystick(self, lx: float, ly: float, rx: float, ry: float) -> Optional[dict]:
-        return self.send_command("joystick", lx=lx, ly=ly, rx=rx, ry=ry)
+    def send_joystick(self, lx: float, ly: float, rx: float, ry: float) -> None:
+        with self.joystick_lock:
+            JOYSTICK_FRAME.pack_into(self._joystick_buf, 0, lx, ly, rx, ry)
+            self._publish_joystick()
+
+    def resend_joystick(self) -> None:
+        """Repeat the last sample; PUB drops sends silently while the robot is not subscribed."""
+        with self.joystick_lock:
+            self._publish_joystick()
+
+    def _publish_joystick(self) -> None:
+        if not self.running:
+            return  # cleanup() closed the socket (under joystick_lock).
+        if not self.robot_ip:
+            return  # Still searching; never drive every candidate robot at once.
+        try:
+            self.joystick_socket.send(self._joystick_buf, zmq.NOBLOCK)
+        except zmq.Again:
+            pass  # A newer sample or the next resend will replace it.
 
-    def send_button(self, button_id: int, action: str) -> Optional[dict]:
-        return self.send_command("button", button_id=button_id, action=action)
+    def send_button(self, button_id: int, action: str) -> None:
+        self._post(_button_payload(button_id, action))
 
     def set_mode(self, mode: str) -> Optional[dict]:
-        return self.send_command("mode", mode=mode)
+        return self._request(_mode_payload(mode))
 
     def reset_robot(self) -> Optional[dict]:
-        return self.send_command("reset")
+        return self._request(RESET_PAYLOAD)
 
     def send_ping(self) -> Optional[dict]:
-        self.ping_sent_time = time.time()
-        return self.send_command("ping")
+        self.ping_sent_time = time.monotonic()
+        return self._request(PING_PAYLOAD)
 
-    def receive_telemetry(self) -> Optional[dict]:
-        """Try to receive telemetry (non-blocking)."""
-        try:
-            data = self.telemetry_socket.recv_json(flags=zmq.NOBLOCK)
+    def send_keepalive(self) -> None:
+        self._post(PING_PAYLOAD)
 
-            self._set_connected(True)
-            self.signals.telemetry_update.emit(data)
-            return data
-        except zmq.Again:
-            return None
-        except Exception as e:
-            print(f"[RobotClient] Telemetry error: {e}")
-            return None
+    def receive_telemetry(self) -> Optional[dict]:
+        """Drain all queued telemetry (non-blocking) and return the newest frame."""
+        last = None
+        while True:
+            try:
+                data = decode_message(self.telemetry_socket.recv(flags=zmq.NOBLOCK))
+            except zmq.Again:
+                break
+            except Exception as e:
+                print(f"[RobotClient] Telemetry error: {e}")
+                break
+            last = data
+
+        if last is None or self._endpoints[self.telemetry_socket] != (self.robot_ip,):
+            return None  # Nothing new, or the socket may still hear other robots.
+        self._set_connected(True)
+        return last
 
     def cleanup(self) -> None:
-        """Clean up sockets and terminate context."""
+        """Close the monitor and the lock-guarded sockets; call from the ConnectionManager thread.
+
+        The telemetry socket is polled without a lock by TelemetryReceiver, so
+        that thread closes it itself via close_telemetry().
+        """
         self.running = False
-        self.command_socket.close(0)
+        self.monitor_socket.close(0)
+        with self.command_lock:
+            self.command_socket.close(0)
+        with self.post_lock:
+            self.post_socket.close(0)
+        with self.joystick_lock:
+            self.joystick_socket.close(0)
+
+    def close_telemetry(self) -> None:
+        """Close the telemetry socket; only the thread polling it may call this."""
         self.telemetry_socket.close(0)
-        self.context.term()
 
 
 class ConnectionManager(threading.Thread):
-    """Manage connection attempts across candidate robot addresses."""
+    """Report robot link status from the command socket's monitor events.
+
+    A single RobotClient searches every candidate address and libzmq handles
+    reconnects. The first robot to link up is selected and the client binds
+    to it alone; if that link drops, the search starts over. Otherwise this
+    thread only confirms links with a ping and emits status changes.
+    """
 
     def __init__(self):
         super().__init__()
@@ -127,85 +372,163 @@ class ConnectionManager(threading.Thread):
         self.client: Optional[RobotClient] = None
         self.lock = threading.Lock()
         self.running = True
-        self.current_address_idx = 0
+        self._client_ready = threading.Event()
         self.daemon = True
 
-    def _advance_address(self) -> None:
-        self.current_address_idx = (self.current_address_idx + 1) % len(ROBOT_ADDRESSES)
+    def _confirm(self, client: RobotClient, address: str) -> None:
+        response = client.send_ping()
+        if response and response.get("status") == "success":
+            print(f"[ConnectionManager] ✅ Connected to {address}")
+            self.signals.connection_status.emit(True, f"{address}:{COMMAND_PORT}")
 
     def run(self) -> None:
         print("[ConnectionManager] Starting...")
 
+        # Build the client outside the lock; only publishing the reference is guarded.
+        client = RobotClient(ROBOT_ADDRESSES)
+        client.signals = self.signals
+        with self.lock:
+            self.client = client
+        self._client_ready.set()
+
+        selected = None  # Robot the client is bound to; None while searching.
         while self.running:
-            with self.lock:
-                if self.client is None or not self.client.connected:
-                    address = ROBOT_ADDRESSES[self.current_address_idx]
-                    print(f"[ConnectionManager] Attempting {address}...")
-
-                    try:
-                        if self.client:
-                            self.client.cleanup()
-
-                        self.client = RobotClient(address)
-                        self.client.signals = self.signals
-
-                        response = self.client.send_ping()
-                        if response and response.get("status") == "success":
-                            print(f"[ConnectionManager] ✅ Connected to {address}")
-                            self.signals.connection_status.emit(True, f"{address}:{COMMAND_PORT}")
-                        else:
-                            self._advance_address()
-                            self.client = None
-                    except Exception as e:
-                        print(f"[ConnectionManager] Connection failed: {e}")
-                        self._advance_address()
-                        self.client = None
-                        self.signals.connection_status.emit(False, "")
-
-            time.sleep(1.0 if self.client is None else 0.5)
+            if not client.monitor_socket.poll(MONITOR_POLL_MS):
+                # Link is up but the robot stopped answering; re-check it.
+                if selected and not client.connected:
+                    self._confirm(client, selected)
+                continue
+
+            event = recv_monitor_message(client.monitor_socket)
+            address = event["endpoint"].decode().split("://", 1)[-1].rsplit(":", 1)[0]
+            if event["event"] == zmq.EVENT_CONNECTED:
+                if selected is None:
+                    # First robot to link up wins. Dropping the other endpoints
+                    # also guarantees the confirming ping is answered by this one.
+                    selected = address
+                    client.select_robot(address)
+                if address == selected:
+                    print(f"[ConnectionManager] Link up to {address}")
+                    self._confirm(client, address)
+            elif event["event"] == zmq.EVENT_DISCONNECTED and address == selected:
+                # Events for other addresses come from endpoints select_robot() dropped.
+                print(f"[ConnectionManager] Lost connection to {address}")
+                selected = None
+                client._set_connected(False)
+                # Search every candidate again; libzmq keeps retrying this one as well.
+                client.select_robot(None)
+
+        self._client_ready.clear()
+        with self.lock:
+            self.client = None
+        client.cleanup()
 
     def get_client(self) -> Optional[RobotClient]:
-        with self.lock:
-            return self.client if self.client and self.client.connected else None
+        # self.lock only guards swapping the client; reading the reference is safe.
+        client = self.client
+        return client if client and client.connected else None
+
+    def wait_for_client(self, timeout: float) -> Optional[RobotClient]:
+        """Block until a connected client is available or ``timeout`` elapses."""
+        if not self._client_ready.wait(timeout):
+            return None
+        client = self.client
+        return client if client and client.wait_connected(timeout) else None
 
     def stop(self) -> None:
+        # run() notices within MONITOR_POLL_MS and closes the client's shared
+        # sockets on its own thread; TelemetryReceiver closes the telemetry socket.
         self.running = False
-        with self.lock:
-            if self.client:
-                self.client.cleanup()
 
 
 class TelemetryReceiver(threading.Thread):
-    """Continuously receive telemetry and send periodic pings."""
+    """Continuously receive telemetry and send periodic keepalives and latency pings."""
 
     def __init__(self, conn_manager):
         super().__init__()
         self.conn_manager = conn_manager
         self.running = True
         self.last_ping_time = 0
+        self.last_keepalive_time = 0
+        # Newest telemetry frame not yet picked up by the GUI.
+        self._latest_telemetry: Optional[dict] = None
+        self._telemetry_lock = threading.Lock()
         self.daemon = True
 
+    def take_telemetry(self) -> Optional[dict]:
+        """Return the newest telemetry frame since the last call, or None."""
+        with self._telemetry_lock:
+            data, self._latest_telemetry = self._latest_telemetry, None
+        return data
+
+    def _ping(self, client: RobotClient) -> None:
+        ping_start = time.perf_counter()
+        response = client.send_ping()
+        client.resend_joystick()
+
+        if response and response.get("status") == "success":
+            ping_ms = (time.perf_counter() - ping_start) * 1000
+            client.signals.ping_response.emit(ping_ms)
+
+        self.last_ping_time = self.last_keepalive_time = time.monotonic()
+
+    def _keepalive(self, client: RobotClient) -> None:
+        # Feeds the robot's watchdog without waiting on a round trip. The joystick
+        # sample is repeated too: samples only go out on change, so a dropped one
+        # (e.g. the release to zero) would otherwise leave the robot driving.
+        client.send_keepalive()
+        client.resend_joystick()
+        self.last_keepalive_time = time.monotonic()
+
     def run(self) -> None:
         print("[TelemetryReceiver] Starting...")
 
+        poller = None
+        polled_client = None
+
         while self.running:
             client = self.conn_manager.get_client()
 
-            if client:
-                client.receive_telemetry()
-                if time.time() - self.last_ping_time > PING_INTERVAL_S:
-                    ping_start = time.time()
-                    response = client.send_ping()
-
-                    if response and response.get("status") == "success":
-                        ping_ms = (time.time() - ping_start) * 1000
-                        client.signals.ping_response.emit(ping_ms)
-
-                    self.last_ping_time = time.time()
-            else:
-                time.sleep(0.1)
-
-            time.sleep(0.01)
+            if client is None:
+                if polled_client is not None and not polled_client.running:
+                    # The manager retired this client; its telemetry socket is ours to close.
+                    polled_client.close_telemetry()
+                    polled_client = None
+                # Park until the link is confirmed instead of polling for it.
+                self.conn_manager.wait_for_client(timeout=1.0)
+                continue
+
+            if client is not polled_client:
+                if polled_client is not None:
+                    polled_client.close_telemetry()
+                poller = zmq.Poller()
+                poller.register(client.telemetry_socket, zmq.POLLIN)
+                polled_client = client
+
+            client.sync_telemetry_endpoints()
+
+            # Sleep in the poller until telemetry arrives or the next ping is due.
+            next_due = min(
+                self.last_ping_time + LATENCY_PING_INTERVAL_S,
+                self.last_keepalive_time + PING_INTERVAL_S,
+            )
+            timeout_ms = max(0, int((next_due - time.monotonic()) * 1000))
+            events = dict(poller.poll(timeout_ms))
+
+            if client.telemetry_socket in events:
+                data = client.receive_telemetry()
+                if data is not None:
+                    with self._telemetry_lock:
+                        self._latest_telemetry = data
+
+            now = time.monotonic()
+            if now - self.last_ping_time >= LATENCY_PING_INTERVAL_S:
+                self._ping(client)
+            elif now - self.last_keepalive_time >= PING_INTERVAL_S:
+                self._keepalive(client)
+
+        if polled_client is not None:
+            polled_client.close_telemetry()
 
     def stop(self) -> None:
         self.running = False
@@ -8,13 +8,11 @@ import pygame
 from PyQt6.QtWidgets import QApplication, QMainWindow
 from PyQt6.QtCore import QTimer, Qt
 from PyQt6.QtGui import QIcon
-from PyQt6 import uic
 
 BASE_DIR = Path(__file__).resolve().parent
 PROJECT_ROOT = BASE_DIR.parents[1]
 LIB_DIR = PROJECT_ROOT / "lib"
 UI_DIR = BASE_DIR / "ui"
-UI_FILE = UI_DIR / "driver_station.ui"
 
 for path in (LIB_DIR, UI_DIR):
     path_str = str(path)
@@ -23,6 +21,9 @@ for path in (LIB_DIR, UI_DIR):
 
 import comm
 from driver_ui import DriverUIHelpers
+# Generated from ui/driver_station.ui; regenerate after editing the .ui file:
+#   pyuic6 ui/driver_station.ui -o ui/driver_station_ui.py
+from driver_station_ui import Ui_MainWindow
 
 # Configure logging
 logging.basicConfig(
@@ -32,13 +33,58 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Constants
-GAMEPAD_POLL_RATE_MS = 20
+GAMEPAD_POLL_RATE_MS = 5  # Cheap when idle: axes are only re-read after a motion event
+MATCH_TIMER_REFRESH_MS = 250
+AXIS_LABEL_REFRESH_MS = 100
+AXIS_LABEL_MIN_CHANGE = 0.05  # Smaller moves are not redrawn (a return to zero always is)
+AXIS_LABEL_REFRESH_TICKS = max(1, AXIS_LABEL_REFRESH_MS // GAMEPAD_POLL_RATE_MS)
 JOYSTICK_THRESHOLD = 0.01  # Minimum change to send update
 MAX_LINEAR_SPEED_MPS = 1.2
 MAX_ANGULAR_SPEED_DPS = 180.0
 EXPECTED_POSE_HORIZON_S = 0.35
 SLOW_DRIVE_SCALE = 0.2
 AXIS_DEADZONE = 0.03
+ZERO_AXES = (0.0, 0.0, 0.0, 0.0)
+JOYSTICK_EVENTS = (pygame.JOYAXISMOTION, pygame.JOYBUTTONDOWN, pygame.JOYBUTTONUP)
+
+# Key codes as plain ints, matching what QKeyEvent.key() returns
+KEY_W = Qt.Key.Key_W.value
+KEY_A = Qt.Key.Key_A.value
+KEY_S = Qt.Key.Key_S.value
+KEY_D = Qt.Key.Key_D.value
+KEY_Q = Qt.Key.Key_Q.value
+KEY_E = Qt.Key.Key_E.value
+KEY_SPACE = Qt.Key.Key_Space.value
+KEY_SHIFT = Qt.Key.Key_Shift.value
+
+KEY_NAMES = {
+    KEY_W: "W", KEY_A: "A", KEY_S: "S", KEY_D: "D",
+    KEY_Q: "Q", KEY_E: "E", KEY_SPACE: "Space", KEY_SHIFT: "Shift",
+}
+
+# Held control keys are tracked as bits in a single int mask
+KEY_BITS = {
+    KEY_W: 1 << 0,
+    KEY_S: 1 << 1,
+    KEY_A: 1 << 2,
+    KEY_D: 1 << 3,
+    KEY_Q: 1 << 4,
+    KEY_E: 1 << 5,
+    KEY_SHIFT: 1 << 6,
+    KEY_SPACE: 1 << 7,
+}
+SHIFT_BIT = KEY_BITS[KEY_SHIFT]
+SPACE_BIT = KEY_BITS[KEY_SPACE]
+
+# Keyboard drive keys -> (key bit, axis index into (lx, ly, rx, ry), direction)
+KEYBOARD_AXES = (
+    (KEY_BITS[KEY_W], 1, 1.0),   # Forward
+    (KEY_BITS[KEY_S], 1, -1.0),  # Backward
+    (KEY_BITS[KEY_A], 0, -1.0),  # Strafe left
+    (KEY_BITS[KEY_D], 0, 1.0),   # Strafe right
+    (KEY_BITS[KEY_Q], 2, -1.0),  # Rotate left
+    (KEY_BITS[KEY_E], 2, 1.0),   # Rotate right
+)
 
 FACE_BUTTON_COLORS = {
     0: "green",   # A
@@ -46,15 +92,36 @@ FACE_BUTTON_COLORS = {
     2: "blue",    # X
     3: "purple",  # Y
 }
+FACE_BUTTON_STYLES = {button: f"color: {color}" for button, color in FACE_BUTTON_COLORS.items()}
+INACTIVE_BUTTON_STYLE = "color: lightgray"
+# Control-mode label text, built once instead of on every gamepad tick
+CONTROL_MODE_TEXT = {
+    "Keyboard": "Control: <b style='color: blue;'>Keyboard</b>",
+    "Gamepad": "Control: <b style='color: green;'>Gamepad</b>",
+    "None": "Control: None",
+}
 
 
-class AppWindow(DriverUIHelpers, QMainWindow):
+class AppWindow(DriverUIHelpers, QMainWindow, Ui_MainWindow):
     def __init__(self):
         super().__init__()
-        uic.loadUi(str(UI_FILE), self)
+        self.setupUi(self)
         self.setup_tabs()
 
+        # Optional widgets, resolved once instead of on every refresh
+        self._has_control_mode_label = hasattr(self, 'control_mode_label')
+        self._has_timer_label = hasattr(self, 'timer')
+        self._has_keyboard_speed_label = hasattr(self, 'keyboard_speed_label')
+        self._has_odo_mode_label = hasattr(self, 'label_odo_mode')
+
         self.joystick = None
+        self._get_axis = None
+        self.face_button_labels = {
+            0: self.button_a_label,
+            1: self.button_b_label,
+            2: self.button_x_label,
+            3: self.button_y_label,
+        }
         self.init_pygame_and_joystick()
 
         # Connection manager (ZMQ-based)
@@ -68,25 +135,41 @@ class AppWindow(DriverUIHelpers, QMainWindow):
         
         # Connect signals
         self.conn_manager.signals.ping_response.connect(self.handle_ping_response)
-        self.conn_manager.signals.telemetry_update.connect(self.handle_telemetry)
+
+        # Telemetry is coalesced by the receiver thread and applied on this tick
+        # rather than queued across threads once per frame.
+        self.telemetry_timer = QTimer(self)
+        self.telemetry_timer.timeout.connect(self.flush_telemetry)
+        self.telemetry_timer.start(comm.TELEMETRY_FLUSH_INTERVAL_MS)
         
         # Gamepad polling timer
-        self.gamepad_timer = QTimer()
+        self.gamepad_timer = QTimer(self)
+        # Coarse timers may stretch a 20 ms interval by several ms; input latency matters here.
+        self.gamepad_timer.setTimerType(Qt.TimerType.PreciseTimer)
         self.gamepad_timer.timeout.connect(self.poll_gamepad)
         self.gamepad_timer.start(GAMEPAD_POLL_RATE_MS)
 
         # Match timer
-        self.match_timer = QTimer()
+        self.match_timer = QTimer(self)
+        self.match_timer.setTimerType(Qt.TimerType.CoarseTimer)
         self.match_timer.timeout.connect(self.update_match_time)
         self.match_time_seconds = 0
         self.match_running = False
         self.auto_duration = 30  # 30 seconds for auto
         self.teleop_duration = 210  # 3 minutes 30 seconds (210 seconds) for teleop
-        self.match_start_time = 0
+        self.match_start_time = 0.0  # time.monotonic() at the start of the current phase
 
         # State tracking
-        self.joystick_values = {'lx': 0.0, 'ly': 0.0, 'rx': 0.0, 'ry': 0.0}
-        self.last_sent_joystick_values = self.joystick_values.copy()
+        # (lx, ly, rx, ry); immutable, so the last-sent snapshot is a plain reference
+        self.joystick_values = ZERO_AXES
+        self.last_sent_joystick_values = ZERO_AXES
+        self._label_text = {}  # Last text set on each frequently refreshed label
+        self._label_style = {}  # Last style sheet set on each frequently restyled label
+        self._axis_label_tick = 0
+        self._shown_axes = None  # Axis values currently displayed in the LX/LY/RX/RY labels
+        self._input_idle = False  # Last tick had no input source and zeros already sent
+        self._gamepad_axes_stale = True  # Re-read gamepad axes even without a motion event
+        self._gamepad_slow = False  # Slow-drive state the current gamepad values were scaled with
         self.current_mode = "STOPPED"
         self.current_pose = {"x": 0.0, "y": 0.0, "theta_deg": 0.0}
         self.expected_pose = self.current_pose.copy()
@@ -104,7 +187,7 @@ class AppWindow(DriverUIHelpers, QMainWindow):
         
         # Keyboard control state
         self.keyboard_enabled = True
-        self.keys_pressed = set()
+        self.keys_pressed = 0  # Bitmask of KEY_BITS
         self.keyboard_speed = 0.7  # Default keyboard speed (0.0 to 1.0)
         
         # Connect mode buttons
@@ -150,9 +233,7 @@ class AppWindow(DriverUIHelpers, QMainWindow):
             self.field_widget.set_expected_pose(base_x, base_y, base_theta_deg)
             return
 
-        lx = float(self.joystick_values.get("lx", 0.0))
-        ly = float(self.joystick_values.get("ly", 0.0))
-        rx = float(self.joystick_values.get("rx", 0.0))
+        lx, ly, rx, _ = self.joystick_values
 
         v_forward = ly * MAX_LINEAR_SPEED_MPS
         v_strafe = lx * MAX_LINEAR_SPEED_MPS
@@ -178,10 +259,10 @@ class AppWindow(DriverUIHelpers, QMainWindow):
         if client:
             response = client.send_command('odometry_mode', mode=mode)
             if response and response.get('status') == 'success':
-                if hasattr(self, 'label_odo_mode'):
+                if self._has_odo_mode_label:
                     self.label_odo_mode.setText(f"Odometry Mode: {mode.title()}")
             else:
-                logger.warning(f"Failed to set odometry mode: {mode}")
+                logger.warning("Failed to set odometry mode: %s", mode)
 
     def reset_odometry(self):
         """Reset odometry pose on robot and local field widget."""
@@ -208,7 +289,7 @@ class AppWindow(DriverUIHelpers, QMainWindow):
         """Switch robot to teleoperated mode (manual start)."""
         if self._set_robot_mode("TELEOP"):
             # Reset timer when manually starting teleop
-            self.match_time_seconds = 0
+            self.match_start_time = time.monotonic()
             if not self.match_running:
                 self.start_match_timer()
             logger.info("Switched to TELEOP mode (manual)")
@@ -217,7 +298,7 @@ class AppWindow(DriverUIHelpers, QMainWindow):
         """Automatically switch from AUTO to TELEOP after 30 seconds."""
         if self._set_robot_mode("TELEOP"):
             # Reset timer for teleop phase
-            self.match_time_seconds = 0
+            self.match_start_time = time.monotonic()
             logger.info("Auto-switched from AUTO to TELEOP at 30 seconds")
     
     def reset_robot(self):
@@ -238,7 +319,7 @@ class AppWindow(DriverUIHelpers, QMainWindow):
 
         response = client.set_mode(mode)
         if not response or response.get("status") != "success":
-            logger.warning(f"Failed to set mode: {mode}")
+            logger.warning("Failed to set mode: %s", mode)
             return False
 
         self.current_mode = mode
@@ -250,28 +331,43 @@ class AppWindow(DriverUIHelpers, QMainWindow):
             self.robot_status.setText("Stopped")
         return True
 
-    def _set_control_mode_label(self, mode_name, color=None):
-        if not hasattr(self, "control_mode_label"):
+    def _set_label_text(self, label, text):
+        """Set label text only when it differs, so unchanged labels are not repainted."""
+        if self._label_text.get(label) != text:
+            self._label_text[label] = text
+            label.setText(text)
+
+    def _set_label_style(self, label, style):
+        """Set a style sheet only when it differs; Qt re-polishes the widget on every call."""
+        if self._label_style.get(label) != style:
+            self._label_style[label] = style
+            label.setStyleSheet(style)
+
+    def _set_control_mode_label(self, mode_name):
+        if self._has_control_mode_label:
+            self._set_label_text(self.control_mode_label, CONTROL_MODE_TEXT[mode_name])
+
+    def _update_axis_labels(self, lx, ly, rx, ry):
+        shown = self._shown_axes
+        if shown is not None and not any(
+            abs(new - old) >= AXIS_LABEL_MIN_CHANGE or (new == 0.0 and old != 0.0)
+            for new, old in zip((lx, ly, rx, ry), shown)
+        ):
             return
-        if color is None:
-            self.control_mode_label.setText(f"Control: {mode_name}")
-        else:
-            self.control_mode_label.setText(f"Control: <b style='color: {color};'>{mode_name}</b>")
+        self._shown_axes = (lx, ly, rx, ry)
+        self._set_label_text(self.lx_label, f"LX: {lx:.2f}")
+        self._set_label_text(self.ly_label, f"LY: {ly:.2f}")
+        self._set_label_text(self.rx_label, f"RX: {rx:.2f}")
+        self._set_label_text(self.ry_label, f"RY: {ry:.2f}")
 
     def _set_face_button_style(self, button_index, active):
-        labels = {
-            0: self.button_a_label,
-            1: self.button_b_label,
-            2: self.button_x_label,
-            3: self.button_y_label,
-        }
-        label = labels.get(button_index)
+        label = self.face_button_labels.get(button_index)
         if label is None:
             return
-        label.setStyleSheet(f"color: {FACE_BUTTON_COLORS[button_index] if active else 'lightgray'}")
+        self._set_label_style(label, FACE_BUTTON_STYLES[button_index] if active else INACTIVE_BUTTON_STYLE)
 
-    def _scaled_axes(self, lx, ly, rx, ry):
-        if self.slow_drive.isChecked():
+    def _scaled_axes(self, lx, ly, rx, ry, slow):
+        if slow:
             return (
                 lx * SLOW_DRIVE_SCALE,
                 ly * SLOW_DRIVE_SCALE,
@@ -283,8 +379,10 @@ class AppWindow(DriverUIHelpers, QMainWindow):
     def start_match_timer(self):
         """Start the match timer."""
         self.match_time_seconds = 0
+        self.match_start_time = time.monotonic()
         self.match_running = True
-        self.match_timer.start(1000)  # Update every second
+        # Elapsed time comes from the monotonic clock, so timer jitter never accumulates.
+        self.match_timer.start(MATCH_TIMER_REFRESH_MS)
         self.update_match_time()
         logger.info("Match timer started")
     
@@ -293,7 +391,7 @@ class AppWindow(DriverUIHelpers, QMainWindow):
         self.match_running = False
         self.match_timer.stop()
         self.match_time_seconds = 0
-        if hasattr(self, 'timer'):
+        if self._has_timer_label:
             self.timer.setText("Time")
         logger.info("Match timer stopped")
     
@@ -302,8 +400,8 @@ class AppWindow(DriverUIHelpers, QMainWindow):
         if not self.match_running:
             return
         
-        minutes = self.match_time_seconds // 60
-        seconds = self.match_time_seconds % 60
+        self.match_time_seconds = int(time.monotonic() - self.match_start_time)
+        minutes, seconds = divmod(self.match_time_seconds, 60)
         
         # AUTO phase logic (30 seconds)
         if self.current_mode == "AUTO":
@@ -324,7 +422,7 @@ class AppWindow(DriverUIHelpers, QMainWindow):
                 time_str = f"Time: OVERTIME +{overtime_minutes}:{overtime_secs:02d}"
                 
                 # Optional: Change status color to indicate overtime
-                self.robot_status.setStyleSheet("color: red; font-weight: bold;")
+                self._set_label_style(self.robot_status, "color: red; font-weight: bold;")
             else:
                 time_str = f"Time: {minutes}:{seconds:02d} (Teleop)"
 
@@ -334,15 +432,19 @@ class AppWindow(DriverUIHelpers, QMainWindow):
         else:
             time_str = f"Time: {minutes}:{seconds:02d}"
         
-        if hasattr(self, 'timer'):
+        if self._has_timer_label:
             self.timer.setText(time_str)
-        
-        self.match_time_seconds += 1
     
     def handle_ping_response(self, ping_ms):
         """Handle ping response from robot."""
-        self.ping_label.setText(f"Ping: {ping_ms:.1f} ms")
+        self._set_label_text(self.ping_label, f"Ping: {ping_ms:.1f} ms")
     
+    def flush_telemetry(self):
+        """Apply the newest telemetry frame received since the last tick."""
+        data = self.telemetry_receiver.take_telemetry()
+        if data is not None:
+            self.handle_telemetry(data)
+
     def handle_telemetry(self, data):
         """Handle telemetry data from robot."""
         # Update UI with telemetry data
@@ -364,19 +466,19 @@ class AppWindow(DriverUIHelpers, QMainWindow):
             self.current_pose = {"x": x_m, "y": y_m, "theta_deg": theta_deg}
             self.update_expected_pose()
 
-            if odometry_mode and hasattr(self, 'label_odo_mode'):
+            if odometry_mode and self._has_odo_mode_label:
                 self.label_odo_mode.setText(f"Odometry Mode: {str(odometry_mode).title()}")
         except Exception as e:
-            logger.error(f"Error parsing telemetry pose: {e}")
+            logger.error("Error parsing telemetry pose: %s", e)
 
-        logger.debug(f"Telemetry: {data}")
+        logger.debug("Telemetry: %s", data)
     
     def update_keyboard_speed(self, value):
         """Update keyboard speed from slider."""
         self.keyboard_speed = value / 100.0
-        if hasattr(self, 'keyboard_speed_label'):
+        if self._has_keyboard_speed_label:
             self.keyboard_speed_label.setText(f"Keyboard Speed: {self.keyboard_speed:.0%}")
-        logger.debug(f"Keyboard speed set to {self.keyboard_speed:.0%}")
+        logger.debug("Keyboard speed set to %.0f%%", self.keyboard_speed * 100)
     
     def keyPressEvent(self, event):
         """Handle keyboard key press events."""
@@ -385,23 +487,16 @@ class AppWindow(DriverUIHelpers, QMainWindow):
         
         key = event.key()
         
-        # Add key to pressed set
-        self.keys_pressed.add(key)
+        # Add key to pressed mask
+        self.keys_pressed |= KEY_BITS.get(key, 0)
         
         # Don't process if auto-repeat
         if event.isAutoRepeat():
             return
 
         # Log key presses for debugging
-        key_names = {
-            Qt.Key.Key_W: "W", Qt.Key.Key_A: "A", 
-            Qt.Key.Key_S: "S", Qt.Key.Key_D: "D",
-            Qt.Key.Key_Q: "Q", Qt.Key.Key_E: "E",
-            Qt.Key.Key_Space: "Space", Qt.Key.Key_Shift: "Shift"
-        }
-        
-        if key in key_names:
-            logger.debug(f"Key pressed: {key_names[key]}")
+        if key in KEY_NAMES:
+            logger.debug("Key pressed: %s", KEY_NAMES[key])
     
     def keyReleaseEvent(self, event):
         """Handle keyboard key release events."""
@@ -410,65 +505,62 @@ class AppWindow(DriverUIHelpers, QMainWindow):
         
         key = event.key()
         
-        # Remove key from pressed set
-        self.keys_pressed.discard(key)
+        # Remove key from pressed mask
+        self.keys_pressed &= ~KEY_BITS.get(key, 0)
         
         # Don't process if auto-repeat
         if event.isAutoRepeat():
             return
     
-    def calculate_keyboard_input(self):
+    def calculate_keyboard_input(self, slow):
         """Calculate joystick values from keyboard input."""
-        lx = 0.0  # Left/right strafe
-        ly = 0.0  # Forward/backward
-        rx = 0.0  # Rotation
+        axes = [0.0, 0.0, 0.0, 0.0]  # lx, ly, rx, ry (ry not used for keyboard)
+        mask = self.keys_pressed
+
+        # No keys held, or emergency stop
+        if not mask or mask & SPACE_BIT:
+            return tuple(axes)
         
         # Base speed (can be boosted with Shift)
         speed = self.keyboard_speed
-        if Qt.Key.Key_Shift in self.keys_pressed:
+        if mask & SHIFT_BIT:
             speed = 1.0  # Full speed with shift
 
-        if self.slow_drive.isChecked():
+        if slow:
             speed *= SLOW_DRIVE_SCALE
         
-        # Movement keys
-        if Qt.Key.Key_W in self.keys_pressed:
-            ly += speed
-        if Qt.Key.Key_S in self.keys_pressed:
-            ly -= speed
-        if Qt.Key.Key_A in self.keys_pressed:
-            lx -= speed
-        if Qt.Key.Key_D in self.keys_pressed:
-            lx += speed
-        
-        # Rotation keys
-        if Qt.Key.Key_Q in self.keys_pressed:
-            rx -= speed
-        if Qt.Key.Key_E in self.keys_pressed:
-            rx += speed
+        # Movement and rotation keys
+        for bit, axis, direction in KEYBOARD_AXES:
+            if mask & bit:
+                axes[axis] += direction * speed
         
-        # Emergency stop
-        if Qt.Key.Key_Space in self.keys_pressed:
-            lx = ly = rx = 0.0
-        
-        return lx, ly, rx, 0.0  # ry not used for keyboard
+        return tuple(axes)
 
     def init_pygame_and_joystick(self):
         """Initialize pygame and detect joystick."""
         try:
-            pygame.init()
+            # Only the subsystems we use; pygame.init() would also start audio, fonts, etc.
+            # The event queue (button events) lives in the video subsystem.
+            pygame.display.init()
             pygame.joystick.init()
+            # Only axis and button events are consumed; queue nothing else (device
+            # and window events from display.init() would otherwise pile up).
+            pygame.event.set_blocked(None)
+            pygame.event.set_allowed(list(JOYSTICK_EVENTS))
             
             if pygame.joystick.get_count() > 0:
                 self.joystick = pygame.joystick.Joystick(0)
                 self.joystick.init()
-                self.gamepad_label.setText(f"Gamepad: {self.joystick.get_name()}")
-                logger.info(f"Found joystick: {self.joystick.get_name()}")
+                # Bound once; poll_gamepad reads four axes per motion tick
+                self._get_axis = self.joystick.get_axis
+                name = self.joystick.get_name()
+                self.gamepad_label.setText(f"Gamepad: {name}")
+                logger.info("Found joystick: %s", name)
             else:
                 self.gamepad_label.setText("Gamepad: Not Found")
                 logger.warning("No joystick found")
         except Exception as e:
-            logger.error(f"Error initializing pygame/joystick: {e}")
+            logger.error("Error initializing pygame/joystick: %s", e)
             self.gamepad_label.setText("Gamepad: Error")
 
     def update_connection_status(self, is_connected, address):
@@ -476,110 +568,133 @@ class AppWindow(DriverUIHelpers, QMainWindow):
         if is_connected:
             self.status_label.setText("Status: <b style='color: green;'>Connected</b>")
             self.address_label.setText(f"Address: {address}")
-            logger.info(f"Connected to {address}")
+            logger.info("Connected to %s", address)
+            # Samples are only sent on change; force the current one out on link-up.
+            self.last_sent_joystick_values = None
+            self._input_idle = False
         else:
             self.status_label.setText("Status: <b style='color: red;'>Disconnected</b>")
             self.address_label.setText("Address: N/A")
-            self.ping_label.setText("Ping: -- ms")
+            self._set_label_text(self.ping_label, "Ping: -- ms")
             self.robot_status.setText("Stopped")
             self.current_mode = "STOPPED"
             
             # Reset button colors
-            self.button_a_label.setStyleSheet("color: lightgray")
-            self.button_b_label.setStyleSheet("color: lightgray")
-            self.button_x_label.setStyleSheet("color: lightgray")
-            self.button_y_label.setStyleSheet("color: lightgray")
+            for label in self.face_button_labels.values():
+                self._set_label_style(label, INACTIVE_BUTTON_STYLE)
             
             logger.warning("Disconnected from robot")
 
     def values_changed_significantly(self, old_values, new_values, threshold=JOYSTICK_THRESHOLD):
         """Check if joystick values changed beyond threshold."""
-        return any(abs(old_values[k] - new_values[k]) > threshold for k in old_values)
+        # Unrolled over (lx, ly, rx, ry); short-circuits on the first moved axis
+        return (
+            abs(old_values[0] - new_values[0]) > threshold
+            or abs(old_values[1] - new_values[1]) > threshold
+            or abs(old_values[2] - new_values[2]) > threshold
+            or abs(old_values[3] - new_values[3]) > threshold
+        )
 
     def poll_gamepad(self):
         """Poll gamepad state and send updates to robot."""
+        if not self.keys_pressed:
+            # Nothing can change until a key is pressed; skip the tick entirely.
+            if self._input_idle:
+                return
+            # Gamepad at rest: nothing queued (peek() also pumps SDL), axes not
+            # stale, and zeros already sent and shown. Any motion queues an event.
+            if (self.joystick is not None
+                    and not self._gamepad_axes_stale
+                    and self.joystick_values == ZERO_AXES
+                    and self.last_sent_joystick_values == ZERO_AXES
+                    and self._shown_axes == ZERO_AXES
+                    and not pygame.event.peek()):
+                return
+
         client = self.conn_manager.get_client()
         if not client:
             return
 
         try:
+            joystick = self.joystick
             # Check if we have keyboard input
-            keyboard_input = self.calculate_keyboard_input()
+            slow = self.slow_drive.isChecked()
+            keyboard_input = self.calculate_keyboard_input(slow)
             has_keyboard_input = any(abs(v) > 0.01 for v in keyboard_input)
             
             # Update control mode indicator
             if has_keyboard_input:
-                self._set_control_mode_label("Keyboard", color="blue")
-            elif self.joystick is not None:
-                self._set_control_mode_label("Gamepad", color="green")
+                self._set_control_mode_label("Keyboard")
+            elif joystick is not None:
+                self._set_control_mode_label("Gamepad")
             else:
                 self._set_control_mode_label("None")
             
             # Use keyboard input if active, otherwise use joystick
             if has_keyboard_input:
-                self.joystick_values['lx'] = keyboard_input[0]
-                self.joystick_values['ly'] = keyboard_input[1]
-                self.joystick_values['rx'] = keyboard_input[2]
-                self.joystick_values['ry'] = keyboard_input[3]
-            elif self.joystick is not None:
-                # Poll joystick only if no keyboard input
-                pygame.event.pump()
-                # Read and apply deadzone to joystick axes
-                axis_lx = self.joystick.get_axis(0)
-                axis_ly = self.joystick.get_axis(1)
-                axis_rx = self.joystick.get_axis(2)
-                axis_ry = self.joystick.get_axis(4)
-
-                self.joystick_values['lx'] = axis_lx if abs(axis_lx) > AXIS_DEADZONE else 0.0
-                self.joystick_values['ly'] = -axis_ly if abs(axis_ly) > AXIS_DEADZONE else 0.0
-                self.joystick_values['rx'] = axis_rx if abs(axis_rx) > AXIS_DEADZONE else 0.0
-                self.joystick_values['ry'] = -axis_ry if abs(axis_ry) > AXIS_DEADZONE else 0.0
-
-                # Handle button events
+                lx, ly, rx, ry = self._scaled_axes(*keyboard_input, slow)
+                self._gamepad_axes_stale = True
+            elif joystick is not None:
+                # Poll joystick only if no keyboard input. event.get() pumps SDL once,
+                # which also refreshes the axis state read below.
+                axes_moved = self._gamepad_axes_stale or slow != self._gamepad_slow
+                # Drain the whole queue; anything SDL refuses to block is just discarded.
                 for event in pygame.event.get():
-                    if event.type == pygame.JOYBUTTONDOWN:
-                        client.send_button(event.button, "DOWN")
-                        if event.button in FACE_BUTTON_COLORS:
-                            self._set_face_button_style(event.button, active=True)
-                            
-                    elif event.type == pygame.JOYBUTTONUP:
-                        client.send_button(event.button, "UP")
-                        if event.button in FACE_BUTTON_COLORS:
-                            self._set_face_button_style(event.button, active=False)
+                    if event.type not in JOYSTICK_EVENTS:
+                        continue
+                    if event.type == pygame.JOYAXISMOTION:
+                        axes_moved = True
+                        continue
+                    pressed = event.type == pygame.JOYBUTTONDOWN
+                    client.send_button(event.button, "DOWN" if pressed else "UP")
+                    if event.button in FACE_BUTTON_COLORS:
+                        self._set_face_button_style(event.button, active=pressed)
+
+                if axes_moved:
+                    # Read joystick axes; deadzone, Y inversion and slow-drive scale in one pass
+                    get_axis = self._get_axis
+                    axis_lx = get_axis(0)
+                    axis_ly = get_axis(1)
+                    axis_rx = get_axis(2)
+                    axis_ry = get_axis(4)
+                    scale = SLOW_DRIVE_SCALE if slow else 1.0
+
+                    lx = axis_lx * scale if abs(axis_lx) > AXIS_DEADZONE else 0.0
+                    ly = axis_ly * -scale if abs(axis_ly) > AXIS_DEADZONE else 0.0
+                    rx = axis_rx * scale if abs(axis_rx) > AXIS_DEADZONE else 0.0
+                    ry = axis_ry * -scale if abs(axis_ry) > AXIS_DEADZONE else 0.0
+                    self._gamepad_axes_stale = False
+                    self._gamepad_slow = slow
+                else:
+                    lx, ly, rx, ry = self.joystick_values
             else:
                 # No input - zero everything
-                self.joystick_values = {'lx': 0.0, 'ly': 0.0, 'rx': 0.0, 'ry': 0.0}
+                lx, ly, rx, ry = ZERO_AXES
 
-            lx, ly, rx, ry = self._scaled_axes(
-                self.joystick_values['lx'],
-                self.joystick_values['ly'],
-                self.joystick_values['rx'],
-                self.joystick_values['ry'],
-            )
-            self.joystick_values['lx'] = lx
-            self.joystick_values['ly'] = ly
-            self.joystick_values['rx'] = rx
-            self.joystick_values['ry'] = ry
-
-            # Update UI labels
-            self.lx_label.setText(f"LX: {self.joystick_values['lx']:.2f}")
-            self.ly_label.setText(f"LY: {self.joystick_values['ly']:.2f}")
-            self.rx_label.setText(f"RX: {self.joystick_values['rx']:.2f}")
-            self.ry_label.setText(f"RY: {self.joystick_values['ry']:.2f}")
-            self.update_expected_pose()
+            values = (lx, ly, rx, ry)
+            if values != self.joystick_values:
+                self.joystick_values = values
+                self.update_expected_pose()
+
+            # Update UI labels at a few Hz; joystick sends below still go out every tick
+            self._axis_label_tick = (self._axis_label_tick + 1) % AXIS_LABEL_REFRESH_TICKS
+            if self._axis_label_tick == 0:
+                self._update_axis_labels(lx, ly, rx, ry)
 
             # Send joystick values if changed significantly
-            if self.values_changed_significantly(self.last_sent_joystick_values, self.joystick_values):
-                client.send_joystick(
-                    self.joystick_values['lx'],
-                    self.joystick_values['ly'],
-                    self.joystick_values['rx'],
-                    self.joystick_values['ry']
-                )
-                self.last_sent_joystick_values = self.joystick_values.copy()
+            if (self.last_sent_joystick_values is None
+                    or self.values_changed_significantly(self.last_sent_joystick_values, values)):
+                client.send_joystick(lx, ly, rx, ry)
+                self.last_sent_joystick_values = values
+
+            idle = joystick is None and self.last_sent_joystick_values == ZERO_AXES
+            if idle and not self._input_idle:
+                # Later ticks return early, so show the zeros now instead of on a refresh tick.
+                self._update_axis_labels(lx, ly, rx, ry)
+            self._input_idle = idle
                 
         except Exception as e:
-            logger.error(f"Error polling gamepad: {e}")
+            logger.error("Error polling gamepad: %s", e)
 
     def closeEvent(self, event):
         """Clean up resources on application close."""
@@ -601,7 +716,7 @@ class AppWindow(DriverUIHelpers, QMainWindow):
                 self.joystick.quit()
                 
         except Exception as e:
-            logger.error(f"Error during cleanup: {e}")
+            logger.error("Error during cleanup: %s", e)
         finally:
             pygame.quit()
             event.accept()
@@ -609,7 +724,6 @@ class AppWindow(DriverUIHelpers, QMainWindow):
 
 
 def main():
-    os.system('cls' if os.name == 'nt' else 'clear')
     app = QApplication(sys.argv)
     icon_path = os.path.join(os.path.dirname(__file__), "app_icon.png")
     if os.path.exists(icon_path):
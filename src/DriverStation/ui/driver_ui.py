@@ -29,6 +29,7 @@ class FieldWidget(QWidget):
         self.expected_x_m = self.robot_x_m
         self.expected_y_m = self.robot_y_m
         self.expected_theta_deg = self.robot_theta_deg
+        self._background = None  # Field and grid pre-rendered at the current widget size.
         self.setMinimumHeight(180)
         self.setStyleSheet("background-color: rgb(15, 20, 25); border: 1px solid rgb(55, 100, 102);")
 
@@ -54,18 +55,24 @@ class FieldWidget(QWidget):
         sy = draw_rect.bottom() - (y_m / self.field_height_m) * draw_rect.height()
         return QPointF(sx, sy)
 
-    def paintEvent(self, event):
-        painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
-
+    def _draw_rect(self):
         margin = 12
-        draw_rect = QRectF(
+        return QRectF(
             margin,
             margin,
             max(10, self.width() - 2 * margin),
             max(10, self.height() - 2 * margin),
         )
 
+    def _render_background(self, draw_rect):
+        """Draw the static field outline and grid once per widget size."""
+        ratio = self.devicePixelRatioF()
+        pixmap = QPixmap(int(self.width() * ratio), int(self.height() * ratio))
+        pixmap.setDevicePixelRatio(ratio)
+        pixmap.fill(Qt.GlobalColor.transparent)
+
+        painter = QPainter(pixmap)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
         painter.fillRect(draw_rect, QColor(30, 45, 55))
         painter.setPen(QPen(QColor(95, 140, 150), 2))
         painter.drawRect(draw_rect)
@@ -76,6 +83,21 @@ class FieldWidget(QWidget):
             y = draw_rect.top() + (draw_rect.height() * i / 6.0)
             painter.drawLine(QPointF(x, draw_rect.top()), QPointF(x, draw_rect.bottom()))
             painter.drawLine(QPointF(draw_rect.left(), y), QPointF(draw_rect.right(), y))
+        painter.end()
+        return pixmap
+
+    def resizeEvent(self, event):
+        self._background = None
+        super().resizeEvent(event)
+
+    def paintEvent(self, event):
+        draw_rect = self._draw_rect()
+        if self._background is None:
+            self._background = self._render_background(draw_rect)
+
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._background)
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing, True)
 
         center = self._field_to_screen(self.robot_x_m, self.robot_y_m, draw_rect)
         robot_radius_px = max(6, min(draw_rect.width(), draw_rect.height()) * 0.03)
@@ -132,21 +132,26 @@ class EncoderMotor:
         self._update_movement(self.default_speed if speed is None else speed)
 
     def move_steps(self, steps: int, speed: Optional[float] = None) -> None:
-        self.target_position = self.get_current_position() + int(steps)
-        if self.min_position is not None and self.target_position < self.min_position:
+        current_position = self.get_current_position()
+        target_position = current_position + int(steps)
+        if self.min_position is not None and target_position < self.min_position:
             raise ValueError("Target position is less than minimum position")
-        if self.max_position is not None and self.target_position > self.max_position:
+        if self.max_position is not None and target_position > self.max_position:
             raise ValueError("Target position is greater than maximum position")
 
-        self._update_movement(self.default_speed if speed is None else speed)
+        self.target_position = target_position
+        self._update_movement(self.default_speed if speed is None else speed, current_position)
 
-    def _update_movement(self, speed: float) -> None:
-        current_position = self.get_current_position()
-        if self.target_position is None:
+    def _update_movement(self, speed: float, current_position: Optional[int] = None) -> None:
+        target_position = self.target_position
+        if target_position is None:
             self.set_speed(0.0)
             return
 
-        distance_to_target = current_position - self.target_position
+        # Encoder reads go through gpiozero; reuse a position the caller already has.
+        if current_position is None:
+            current_position = self.get_current_position()
+        distance_to_target = current_position - target_position
         if abs(distance_to_target) <= self.position_tolerance:
             self.set_speed(0.0)
             return
@@ -1,33 +1,59 @@
+import atexit
 import os
+import json
+import functools
 import math
+import queue
 import logging
+import logging.handlers
+import struct
 import threading
 import time
 from dataclasses import dataclass
-from typing import Any, Dict, List
+from typing import Any, Dict, List, Tuple
 
 import zmq
 
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
 try:
     from hardware import PwmMotor
 except Exception:
     PwmMotor = None
 
-# Configure logging
+# Configure logging. Records are queued and written to stderr by a listener
+# thread, so the command and watchdog threads never block on console I/O.
+_log_queue = queue.SimpleQueue()
+_log_output = logging.StreamHandler()
+_log_output.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
+log_listener = logging.handlers.QueueListener(_log_queue, _log_output)
+# The QueueHandler only merges msg % args; the listener's handler applies the real format.
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    format='%(message)s',
+    handlers=[logging.handlers.QueueHandler(_log_queue)]
 )
+# Started alongside the handler so importers (tools, test scripts) see output too;
+# stopped at exit to flush whatever is still queued.
+log_listener.start()
+atexit.register(log_listener.stop)
 logger = logging.getLogger(__name__)
 
 # Constants
 COMMAND_PORT = 5555
 TELEMETRY_PORT = 5556
+JOYSTICK_PORT = 5557
+# Joystick stream frame, must match comm.py: four little-endian float32s (lx, ly, rx, ry).
+JOYSTICK_FRAME = struct.Struct("<4f")
 TELEMETRY_RATE_HZ = 10
 # Must be greater than driver ping interval (comm.py PING_INTERVAL_S=1s),
 # otherwise idle teleop will flap between lost/restored each second.
 HEARTBEAT_TIMEOUT_S = 2.5
-WATCHDOG_CHECK_INTERVAL_S = 0.1
+# Upper bound on how long command_loop can miss a shutdown request.
+COMMAND_POLL_TIMEOUT_MS = 100
 MAX_LINEAR_SPEED_MPS = 1.2
 MAX_ANGULAR_SPEED_DPS = 180.0
 FIELD_WIDTH_M = 3.6
@@ -64,10 +90,16 @@ INPUT_EXPO = 1.4
 # Most setups already map forward to positive LY in driver.py.
 # Override with KSU_JOYSTICK_Y_SIGN=1.0 if your controller is already forward-positive.
 JOYSTICK_Y_SIGN = float(os.environ.get("KSU_JOYSTICK_Y_SIGN", "-1.0"))
+# Optional latency tuning for the command thread (Linux only). -1 / 0 leave the defaults.
+# SCHED_FIFO needs root or CAP_SYS_NICE; without it the thread keeps normal scheduling.
+COMMAND_THREAD_CPU = int(os.environ.get("KSU_COMMAND_CPU", "-1"))
+COMMAND_THREAD_RT_PRIORITY = int(os.environ.get("KSU_COMMAND_RT_PRIORITY", "0"))
 
 # Global state
-last_heartbeat = time.time()
+last_heartbeat = time.monotonic()
 heartbeat_lock = threading.Lock()
+# Set by update_heartbeat() to wake a watchdog parked on a lost connection.
+heartbeat_restored = threading.Event()
 connection_lost = False
 robot_mode = "STOPPED"  # STOPPED, AUTO, TELEOP
 motor_controller = None
@@ -82,6 +114,8 @@ class MotorController:
         self.available = PwmMotor is not None
         self.motors = []
         self.lock = threading.Lock()
+        # Last speeds written to the drivers; repeats are skipped (each PCA write is an I2C transfer).
+        self._last_speeds = None
 
         if not self.available:
             logger.warning("Motor hardware unavailable (hardware.py / gpiozero import failed). Running in simulation mode.")
@@ -105,13 +139,17 @@ class MotorController:
         if not self.available:
             return
 
+        speeds = tuple(speeds)
         if len(speeds) != 4:
             raise ValueError("Expected 4 motor speeds [FL, FR, RL, RR]")
 
         with self.lock:
+            if speeds == self._last_speeds:
+                return
             for i, speed in enumerate(speeds):
                 command = self._clamp(speed) * float(MOTOR_DIRECTION_MULTIPLIER[i])
                 self.motors[i].set_speed(command)
+            self._last_speeds = speeds
 
     def stop(self) -> None:
         self.set_speeds(ZERO_MOTOR_SPEEDS)
@@ -128,9 +166,9 @@ def _clamp_unit(value: float) -> float:
     return max(-1.0, min(1.0, float(value)))
 
 
-@dataclass
+@dataclass(slots=True)
 class JoystickData:
-    """Container for joystick input data."""
+    """Container for joystick input data; one is built per joystick sample, so no __dict__."""
 
     lx: float = 0.0
     ly: float = 0.0
@@ -144,6 +182,22 @@ class JoystickData:
         self.ry = _clamp_unit(self.ry)
 
 
+def encode_message(message: Dict[str, Any]) -> bytes:
+    """Serialize a reply/telemetry dict, preferring msgpack over JSON."""
+    if msgpack is not None:
+        return msgpack.packb(message, use_bin_type=True)
+    return json.dumps(message).encode('utf-8')
+
+
+def decode_message(payload: bytes) -> Dict[str, Any]:
+    """Decode a msgpack or JSON payload (JSON always starts with '{')."""
+    if payload[:1] == b'{':
+        return json.loads(payload)
+    if msgpack is None:
+        raise RuntimeError("Received a msgpack payload but msgpack is not installed.")
+    return msgpack.unpackb(payload, raw=False)
+
+
 def all_stop() -> None:
     """Emergency stop - called when connection is lost."""
     global connection_lost
@@ -155,60 +209,74 @@ def all_stop() -> None:
 
 def watchdog_thread() -> None:
     """Monitor heartbeat and trigger emergency stop if connection lost."""
-    global connection_lost
     logger.info("Watchdog thread started")
-    
+
     while True:
         with heartbeat_lock:
-            time_since_heartbeat = time.time() - last_heartbeat
-            
-            if time_since_heartbeat > HEARTBEAT_TIMEOUT_S:
-                if not connection_lost:
-                    all_stop()
-            elif connection_lost:
-                logger.info("Connection restored")
-                connection_lost = False
-                
-        time.sleep(WATCHDOG_CHECK_INTERVAL_S)
+            remaining = HEARTBEAT_TIMEOUT_S - (time.monotonic() - last_heartbeat)
+            if remaining <= 0.0:
+                all_stop()
+                heartbeat_restored.clear()
 
+        if remaining > 0.0:
+            # Sleep to the current deadline; heartbeats meanwhile only push it later.
+            time.sleep(remaining)
+        else:
+            # Stopped: nothing to check until a command arrives. The wait is
+            # bounded so a missed wakeup can never park the watchdog for good.
+            heartbeat_restored.wait(HEARTBEAT_TIMEOUT_S)
+
+
+# Joystick axes are quantized to this many steps per unit before the mixer lookup.
+MOTOR_SPEED_QUANT_STEPS = 127
+
+
+def _apply_deadband(value: float, deadband: float) -> float:
+    if abs(value) < deadband:
+        return 0.0
+
+    # Rescale to keep full-range response after deadband.
+    sign = 1.0 if value >= 0.0 else -1.0
+    scaled = (abs(value) - deadband) / (1.0 - deadband)
+    return sign * scaled
 
-def calculate_motor_speeds(data: JoystickData) -> List[float]:
-    """
-    Calculate mecanum drive motor speeds from joystick input.
-    Returns: List of 4 motor speeds [FL, FR, RL, RR]
-    """
-    def apply_deadband(value, deadband):
-        value = float(value)
-        if abs(value) < deadband:
-            return 0.0
 
-        # Rescale to keep full-range response after deadband.
-        sign = 1.0 if value >= 0.0 else -1.0
-        scaled = (abs(value) - deadband) / (1.0 - deadband)
-        return sign * scaled
+def _shape_input(value: float, expo: float) -> float:
+    value = max(-1.0, min(1.0, value))
+    sign = 1.0 if value >= 0.0 else -1.0
+    return sign * (abs(value) ** expo)
 
-    def shape_input(value, expo):
-        value = max(-1.0, min(1.0, float(value)))
-        sign = 1.0 if value >= 0.0 else -1.0
-        return sign * (abs(value) ** expo)
 
-    x = shape_input(apply_deadband(data.lx, JOYSTICK_DEADBAND), INPUT_EXPO)  # strafe
-    y = shape_input(apply_deadband(data.ly, JOYSTICK_DEADBAND), INPUT_EXPO)  # forward
-    z = shape_input(apply_deadband(data.rx, JOYSTICK_DEADBAND), INPUT_EXPO)  # rotate
+@functools.lru_cache(maxsize=4096)
+def _motor_speeds_q(lx_q: int, ly_q: int, rx_q: int) -> Tuple[float, float, float, float]:
+    """Mecanum mix for quantized (strafe, forward, rotate) inputs; cached, so returns a tuple."""
+    step = 1.0 / MOTOR_SPEED_QUANT_STEPS
+    x = _shape_input(_apply_deadband(lx_q * step, JOYSTICK_DEADBAND), INPUT_EXPO)  # strafe
+    y = _shape_input(_apply_deadband(ly_q * step, JOYSTICK_DEADBAND), INPUT_EXPO)  # forward
+    z = _shape_input(_apply_deadband(rx_q * step, JOYSTICK_DEADBAND), INPUT_EXPO)  # rotate
 
     motor1_speed = y + x + z  # Front Left
     motor2_speed = y - x - z  # Front Right
     motor3_speed = y - x + z  # Rear Left
     motor4_speed = y + x - z  # Rear Right
 
-    speeds = [motor1_speed, motor2_speed, motor3_speed, motor4_speed]
-    
-    # Normalize speeds
-    max_speed = max(abs(s) for s in speeds)
-    if max_speed > 1.0:
-        speeds = [s / max_speed for s in speeds]
+    # Normalize speeds: one reciprocal, four multiplies, a single tuple build
+    max_speed = max(abs(motor1_speed), abs(motor2_speed), abs(motor3_speed), abs(motor4_speed))
+    inv = 1.0 / max_speed if max_speed > 1.0 else 1.0
 
-    return speeds
+    return (motor1_speed * inv, motor2_speed * inv, motor3_speed * inv, motor4_speed * inv)
+
+
+def calculate_motor_speeds(data: JoystickData) -> Tuple[float, float, float, float]:
+    """
+    Calculate mecanum drive motor speeds from joystick input.
+    Returns: Tuple of 4 motor speeds (FL, FR, RL, RR)
+    """
+    return _motor_speeds_q(
+        round(data.lx * MOTOR_SPEED_QUANT_STEPS),
+        round(data.ly * MOTOR_SPEED_QUANT_STEPS),
+        round(data.rx * MOTOR_SPEED_QUANT_STEPS),
+    )
 
 
 def set_motor_speeds(speeds: List[float]) -> None:
@@ -217,17 +285,20 @@ def set_motor_speeds(speeds: List[float]) -> None:
     try:
         controller.set_speeds(speeds)
     except Exception as e:
-        logger.error(f"Failed to set motor speeds: {e}")
+        logger.error("Failed to set motor speeds: %s", e)
 
 
 def update_heartbeat() -> None:
     """Update the last heartbeat timestamp."""
     global last_heartbeat, connection_lost
+    # Store and check under the lock so a restore can't slip between the
+    # watchdog's deadline check and its all_stop().
     with heartbeat_lock:
-        last_heartbeat = time.time()
+        last_heartbeat = time.monotonic()
         if connection_lost:
             logger.info("Connection restored via command")
             connection_lost = False
+            heartbeat_restored.set()
 
 
 class RobotServer:
@@ -235,20 +306,28 @@ class RobotServer:
     def __init__(self):
         self.context = zmq.Context()
         
-        # REP socket for commands
-        self.command_socket = self.context.socket(zmq.REP)
+        # ROUTER socket for commands; frames are [identity, request_id, payload]
+        self.command_socket = self.context.socket(zmq.ROUTER)
         self.command_socket.bind(f"tcp://*:{COMMAND_PORT}")
         
-        # PUB socket for telemetry
+        # PUB socket for telemetry; a slow subscriber only ever gets the newest frame
         self.telemetry_socket = self.context.socket(zmq.PUB)
+        self.telemetry_socket.setsockopt(zmq.CONFLATE, 1)
+        self.telemetry_socket.setsockopt(zmq.SNDHWM, 1)
         self.telemetry_socket.bind(f"tcp://*:{TELEMETRY_PORT}")
+
+        # SUB socket for the joystick stream; only the newest sample is kept
+        self.joystick_socket = self.context.socket(zmq.SUB)
+        self.joystick_socket.setsockopt(zmq.CONFLATE, 1)
+        self.joystick_socket.subscribe("")
+        self.joystick_socket.bind(f"tcp://*:{JOYSTICK_PORT}")
         
         self.running = True
         self.camera_thread = None
         self.pose_x_m = FIELD_WIDTH_M / 2.0
         self.pose_y_m = FIELD_HEIGHT_M / 2.0
         self.pose_theta_deg = 0.0
-        self.last_pose_update = time.time()
+        self.last_pose_update = time.monotonic()
         self.odometry_mode = "PRE_START"
         self.telemetry_data: Dict[str, Any] = {
             'battery': 12.5,
@@ -271,7 +350,18 @@ class RobotServer:
             }
         }
         
-        logger.info(f"Robot server initialized on ports {COMMAND_PORT}/{TELEMETRY_PORT}")
+        # Command type -> handler; each takes the decoded command and returns the reply
+        self._command_handlers = {
+            'ping': self._cmd_ping,
+            'joystick': self._cmd_joystick,
+            'button': self._cmd_button,
+            'mode': self._cmd_mode,
+            'reset': self._cmd_reset,
+            'reset_odometry': self._cmd_reset_odometry,
+            'odometry_mode': self._cmd_odometry_mode,
+        }
+
+        logger.info("Robot server initialized on ports %s/%s/%s", COMMAND_PORT, TELEMETRY_PORT, JOYSTICK_PORT)
 
     def _stop_drive(self) -> None:
         set_motor_speeds(ZERO_MOTOR_SPEEDS)
@@ -286,23 +376,23 @@ class RobotServer:
         try:
             import camera as camera_module
         except Exception as e:
-            logger.warning(f"Camera module unavailable: {e}")
+            logger.warning("Camera module unavailable: %s", e)
             return
 
         def run_camera_server():
             try:
                 camera_module.main()
             except Exception as e:
-                logger.error(f"Camera broadcast stopped: {e}")
+                logger.error("Camera broadcast stopped: %s", e)
 
         self.camera_thread = threading.Thread(target=run_camera_server, daemon=True, name="camera-broadcast")
         self.camera_thread.start()
         stream_port = getattr(camera_module, "PORT", 8080)
-        logger.info(f"Camera broadcast started on port {stream_port}")
+        logger.info("Camera broadcast started on port %s", stream_port)
 
     def _integrate_pose(self, lx: float, ly: float, rx: float) -> None:
         """Simple dead-reckoning from joystick commands."""
-        now = time.time()
+        now = time.monotonic()
         dt = max(0.0, min(0.2, now - self.last_pose_update))
         self.last_pose_update = now
         if dt <= 0:
@@ -327,7 +417,7 @@ class RobotServer:
         self.pose_x_m = FIELD_WIDTH_M / 2.0
         self.pose_y_m = FIELD_HEIGHT_M / 2.0
         self.pose_theta_deg = 0.0
-        self.last_pose_update = time.time()
+        self.last_pose_update = time.monotonic()
     
     def _read_drive_inputs(self, command: Dict[str, Any]) -> JoystickData:
         return JoystickData(
@@ -337,6 +427,15 @@ class RobotServer:
             ry=float(command.get("ry", 0.0)),
         )
 
+    def _apply_joystick(self, joystick_data: JoystickData) -> None:
+        motor_speeds = calculate_motor_speeds(joystick_data)
+
+        if robot_mode == "TELEOP":
+            self._integrate_pose(joystick_data.lx, joystick_data.ly, joystick_data.rx)
+            set_motor_speeds(motor_speeds)
+            self.telemetry_data['motor_speeds'] = motor_speeds
+            logger.debug("Motors: %s", motor_speeds)
+
     def _update_telemetry_pose(self) -> None:
         self.telemetry_data["pose"] = {
             "x": self.pose_x_m,
@@ -344,100 +443,136 @@ class RobotServer:
             "theta_deg": self.pose_theta_deg,
         }
 
+    def _cmd_ping(self, command: Dict[str, Any]) -> Dict[str, Any]:
+        return {'status': 'success', 'timestamp': time.time()}
+
+    def _cmd_joystick(self, command: Dict[str, Any]) -> Dict[str, Any]:
+        self._apply_joystick(self._read_drive_inputs(command))
+        return {'status': 'success'}
+
+    def _cmd_button(self, command: Dict[str, Any]) -> Dict[str, Any]:
+        button_id = command.get('button_id')
+        action = command.get('action')
+        logger.info("Button %s %s", button_id, action)
+
+        # TODO: Handle button actions
+
+        return {'status': 'success'}
+
+    def _cmd_mode(self, command: Dict[str, Any]) -> Dict[str, Any]:
+        global robot_mode
+        new_mode = command.get('mode', 'STOPPED').upper()
+
+        if new_mode in VALID_ROBOT_MODES:
+            robot_mode = new_mode
+            self.telemetry_data['mode'] = robot_mode
+            logger.info("Mode changed to: %s", robot_mode)
+
+            if robot_mode == "STOPPED":
+                self._stop_drive()
+
+            return {'status': 'success', 'mode': robot_mode}
+        else:
+            return {'status': 'error', 'message': f'Invalid mode: {new_mode}'}
+
+    def _cmd_reset(self, command: Dict[str, Any]) -> Dict[str, Any]:
+        global robot_mode
+        robot_mode = "STOPPED"
+        self._stop_drive()
+        self._reset_pose()
+        self.telemetry_data['mode'] = robot_mode
+        logger.info("Robot reset")
+        return {'status': 'success'}
+
+    def _cmd_reset_odometry(self, command: Dict[str, Any]) -> Dict[str, Any]:
+        self._reset_pose()
+        logger.info("Odometry reset")
+        return {'status': 'success'}
+
+    def _cmd_odometry_mode(self, command: Dict[str, Any]) -> Dict[str, Any]:
+        mode = str(command.get('mode', 'PRE_START')).upper()
+        if mode in VALID_ODOMETRY_MODES:
+            self.odometry_mode = mode
+            self.telemetry_data['odometry_mode'] = self.odometry_mode
+            return {'status': 'success', 'odometry_mode': self.odometry_mode}
+        return {'status': 'error', 'message': f'Invalid odometry mode: {mode}'}
+
     def handle_command(self, command: Dict[str, Any]) -> Dict[str, Any]:
         """Process incoming command"""
-        global robot_mode
-        
         cmd_type = command.get('type')
         update_heartbeat()
-        
+
         try:
-            if cmd_type == 'ping':
-                return {'status': 'success', 'timestamp': time.time()}
-            
-            elif cmd_type == 'joystick':
-                joystick_data = self._read_drive_inputs(command)
-                motor_speeds = calculate_motor_speeds(joystick_data)
-                
-                if robot_mode == "TELEOP":
-                    self._integrate_pose(joystick_data.lx, joystick_data.ly, joystick_data.rx)
-                    set_motor_speeds(motor_speeds)
-                    self.telemetry_data['motor_speeds'] = motor_speeds
-                    logger.debug(f"Motors: {motor_speeds}")
-                
-                return {'status': 'success'}
-            
-            elif cmd_type == 'button':
-                button_id = command.get('button_id')
-                action = command.get('action')
-                logger.info(f"Button {button_id} {action}")
-                
-                # TODO: Handle button actions
-                
-                return {'status': 'success'}
-            
-            elif cmd_type == 'mode':
-                new_mode = command.get('mode', 'STOPPED').upper()
-                
-                if new_mode in VALID_ROBOT_MODES:
-                    robot_mode = new_mode
-                    self.telemetry_data['mode'] = robot_mode
-                    logger.info(f"Mode changed to: {robot_mode}")
-                    
-                    if robot_mode == "STOPPED":
-                        self._stop_drive()
-                    
-                    return {'status': 'success', 'mode': robot_mode}
-                else:
-                    return {'status': 'error', 'message': f'Invalid mode: {new_mode}'}
-            
-            elif cmd_type == 'reset':
-                robot_mode = "STOPPED"
-                self._stop_drive()
-                self._reset_pose()
-                self.telemetry_data['mode'] = robot_mode
-                logger.info("Robot reset")
-                return {'status': 'success'}
-
-            elif cmd_type == 'reset_odometry':
-                self._reset_pose()
-                logger.info("Odometry reset")
-                return {'status': 'success'}
-
-            elif cmd_type == 'odometry_mode':
-                mode = str(command.get('mode', 'PRE_START')).upper()
-                if mode in VALID_ODOMETRY_MODES:
-                    self.odometry_mode = mode
-                    self.telemetry_data['odometry_mode'] = self.odometry_mode
-                    return {'status': 'success', 'odometry_mode': self.odometry_mode}
-                return {'status': 'error', 'message': f'Invalid odometry mode: {mode}'}
-            
-            else:
-                logger.warning(f"Unknown command: {cmd_type}")
+            handler = self._command_handlers.get(cmd_type)
+            if handler is None:
+                logger.warning("Unknown command: %s", cmd_type)
                 return {'status': 'error', 'message': f'Unknown command: {cmd_type}'}
-                
+            return handler(command)
         except Exception as e:
-            logger.error(f"Error handling command: {e}")
+            logger.error("Error handling command: %s", e)
             return {'status': 'error', 'message': str(e)}
     
+    def _handle_command_frame(self) -> None:
+        envelope = None
+        try:
+            identity, request_id, payload = self.command_socket.recv_multipart()
+            envelope = [identity, request_id]
+            response = self.handle_command(decode_message(payload))
+            self.command_socket.send_multipart(envelope + [encode_message(response)])
+        except Exception as e:
+            logger.error("Command loop error: %s", e)
+            if envelope is None:
+                return
+            try:
+                self.command_socket.send_multipart(envelope + [encode_message({
+                    'status': 'error',
+                    'message': str(e)
+                })])
+            except Exception:
+                pass
+
+    def _handle_joystick_frame(self) -> None:
+        """Apply the latest joystick sample; the stream is fire-and-forget, so no reply."""
+        try:
+            lx, ly, rx, ry = JOYSTICK_FRAME.unpack(self.joystick_socket.recv())
+            update_heartbeat()
+            self._apply_joystick(JoystickData(lx=lx, ly=ly * JOYSTICK_Y_SIGN, rx=rx, ry=ry))
+        except Exception as e:
+            logger.error("Joystick stream error: %s", e)
+
+    @staticmethod
+    def _tune_command_thread() -> None:
+        """Best-effort CPU pinning and real-time priority for the calling thread."""
+        if COMMAND_THREAD_CPU >= 0:
+            try:
+                os.sched_setaffinity(0, {COMMAND_THREAD_CPU})
+                logger.info("Command thread pinned to CPU %d", COMMAND_THREAD_CPU)
+            except (AttributeError, OSError) as e:
+                logger.warning("Could not pin command thread to CPU %d: %s", COMMAND_THREAD_CPU, e)
+
+        if COMMAND_THREAD_RT_PRIORITY > 0:
+            try:
+                os.sched_setscheduler(0, os.SCHED_FIFO, os.sched_param(COMMAND_THREAD_RT_PRIORITY))
+                logger.info("Command thread using SCHED_FIFO priority %d", COMMAND_THREAD_RT_PRIORITY)
+            except (AttributeError, OSError) as e:
+                logger.warning("Could not enable SCHED_FIFO for command thread: %s", e)
+
     def command_loop(self) -> None:
-        """Handle incoming commands"""
+        """Handle incoming commands and joystick samples"""
+        # Runs after the watchdog/telemetry/camera threads start, so only this thread is affected.
+        self._tune_command_thread()
         logger.info("Command handler ready")
-        
+
+        poller = zmq.Poller()
+        poller.register(self.command_socket, zmq.POLLIN)
+        poller.register(self.joystick_socket, zmq.POLLIN)
+
         while self.running:
-            try:
-                command = self.command_socket.recv_json()
-                response = self.handle_command(command)
-                self.command_socket.send_json(response)
-            except Exception as e:
-                logger.error(f"Command loop error: {e}")
-                try:
-                    self.command_socket.send_json({
-                        'status': 'error',
-                        'message': str(e)
-                    })
-                except Exception:
-                    pass
+            events = dict(poller.poll(COMMAND_POLL_TIMEOUT_MS))
+            if self.joystick_socket in events:
+                self._handle_joystick_frame()
+            if self.command_socket in events:
+                self._handle_command_frame()
     
     def telemetry_loop(self) -> None:
         """Broadcast telemetry"""
@@ -454,11 +589,11 @@ class RobotServer:
                 self.telemetry_data['odometry_mode'] = self.odometry_mode
                 self._update_telemetry_pose()
                 
-                self.telemetry_socket.send_json(self.telemetry_data)
+                self.telemetry_socket.send(encode_message(self.telemetry_data))
                 time.sleep(1.0 / TELEMETRY_RATE_HZ)
                 
             except Exception as e:
-                logger.error(f"Telemetry error: {e}")
+                logger.error("Telemetry error: %s", e)
     
     def start(self) -> None:
         """Start server threads"""
@@ -485,9 +620,11 @@ class RobotServer:
         try:
             ensure_motor_controller().stop()
         except Exception as e:
-            logger.error(f"Failed to stop motors during cleanup: {e}")
-        self.command_socket.close()
-        self.telemetry_socket.close()
+            logger.error("Failed to stop motors during cleanup: %s", e)
+        # Drop unsent frames so context.term() does not wait on a vanished driver station.
+        self.command_socket.close(0)
+        self.telemetry_socket.close(0)
+        self.joystick_socket.close(0)
         self.context.term()
 
 